@@ -18,58 +18,124 @@ Usage:
     python main.py --config my.json   # Use custom trader config
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
 import time
 import signal
+import asyncio
 import argparse
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from dataclasses import asdict
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from datetime import datetime, timedelta
+import dataclasses
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# py_clob_client / requests / eth crypto trees are expensive to import;
+# the src modules that pull them in are loaded lazily where first used
+# so `--help` and config errors stay fast
+if TYPE_CHECKING:
+    from src.trader_monitor import TraderMonitor, TraderConfig, Trade
+    from src.order_executor import OrderExecutor, CopyTradeConfig
+
+
+# Default traders.json template, pre-serialized once at import so the
+# missing-config path is a single write
+_DEFAULT_TRADERS_CONFIG = {
+    "traders": [
+        {
+            "address": "0xYOUR_TRADER_ADDRESS_HERE",
+            "nickname": "Trader1",
+            "enabled": False,
+            "copy_buys": True,
+            "copy_sells": True,
+            "max_position_size": 500,
+            "notes": "Add your traders here"
+        }
+    ],
+    "global_settings": {
+        "enabled": True,
+        "copy_delay_seconds": 1,
+        "max_concurrent_trades": 5,
+        "stop_on_error": False
+    }
+}
 
-from src.auth import PolymarketAuth, setup_auth_from_env
-from src.trader_monitor import (
-    TraderMonitor, 
-    TraderConfig, 
-    Trade, 
-    load_traders_from_json,
-    DataAPIClient,
-    GammaAPIClient
-)
-from src.order_executor import OrderExecutor, CopyTradeConfig
-from src.websocket_client import PolymarketWebSocket
+if orjson is not None:
+    _DEFAULT_TRADERS_BYTES = orjson.dumps(
+        _DEFAULT_TRADERS_CONFIG, option=orjson.OPT_INDENT_2)
+else:
+    _DEFAULT_TRADERS_BYTES = json.dumps(_DEFAULT_TRADERS_CONFIG, indent=2).encode()
 
 
 # Configure logging
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     """Setup logging configuration"""
-    level = getattr(logging, log_level.upper(), logging.INFO)
-    
+    level = _LOG_LEVELS.get(log_level.upper(), logging.INFO)
+
     handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
-    
+
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         handlers.append(logging.FileHandler(log_path))
-    
+
+    # force=True closes and replaces any handlers from a previous call,
+    # so re-instantiating the bot in-process actually reconfigures
+    # logging instead of silently no-oping (and doesn't leak handles)
     logging.basicConfig(
         level=level,
         format="%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=handlers
+        handlers=handlers,
+        force=True
     )
-    
+
     return logging.getLogger(__name__)
 
 
+class BotStats:
+    """
+    Bot runtime counters.
+
+    Slotted so hot-path increments are plain attribute stores, and
+    timestamps stay as raw time.monotonic_ns() integers — formatting
+    happens only when stats are displayed. A plain class rather than
+    @dataclass(slots=True), which requires Python 3.10 (the supported
+    floor is 3.9).
+    """
+    __slots__ = ("trades_detected", "trades_executed", "trades_skipped",
+                 "errors", "start_time", "last_activity")
+
+    def __init__(self) -> None:
+        self.trades_detected: int = 0
+        self.trades_executed: int = 0
+        self.trades_skipped:  int = 0
+        self.errors:          int = 0
+        self.start_time:    Optional[int] = None   # time.monotonic_ns()
+        self.last_activity: Optional[int] = None   # time.monotonic_ns()
+
+
 class CopyTradingBot:
     """
     Main Copy Trading Bot
@@ -115,12 +181,22 @@ class CopyTradingBot:
         # Load traders config
         self.traders_config_path = traders_config_path
         self.traders = self._load_traders()
+
+        # Precomputed indexes: enabled list for verify/run, address dict
+        # so event dispatch resolves a trader in O(1)
+        self._enabled_traders = [t for t in self.traders if t.enabled]
+        self._traders_by_address = {t.address.lower(): t for t in self._enabled_traders}
         
-        # Setup copy config
-        self.copy_config = copy_config or CopyTradeConfig.from_env()
-        
+        # Setup copy config: main() builds this once from a single env
+        # read, so __init__ never re-reads the environment behind it
+        if copy_config is None:
+            from src.order_executor import CopyTradeConfig
+            copy_config = CopyTradeConfig.from_env()
+        self.copy_config = copy_config
+
         # Setup authentication
         self.logger.info("Setting up authentication...")
+        from src.auth import PolymarketAuth
         self.auth = PolymarketAuth(
             private_key=private_key,
             funder_address=funder_address,
@@ -130,69 +206,62 @@ class CopyTradingBot:
         # Initialize components (lazy)
         self._monitor: Optional[TraderMonitor] = None
         self._executor: Optional[OrderExecutor] = None
+        self._ws = None
         
+        # Execution pool: order signing + CLOB round-trips run here so
+        # the detection path never blocks on an order in flight
+        self._exec_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("EXEC_WORKERS", "4")),
+            thread_name_prefix="copy-exec"
+        )
+
         # State
         self._running = False
-        self._stats = {
-            "trades_detected": 0,
-            "trades_executed": 0,
-            "trades_skipped": 0,
-            "errors": 0,
-            "start_time": None,
-            "last_activity": None
-        }
+        self._stats_lock = threading.Lock()
+        self._stats = BotStats()
+        self._wall_start = datetime.now()  # wall clock, display only
     
     def _load_traders(self) -> List[TraderConfig]:
         """Load trader configurations"""
+        from src.trader_monitor import load_traders_from_json
+
         try:
             traders = load_traders_from_json(self.traders_config_path)
-            self.logger.info(f"Loaded {len(traders)} traders from config")
+            self.logger.info("Loaded %d traders from config", len(traders))
             return traders
         except FileNotFoundError:
-            self.logger.warning(f"Traders config not found: {self.traders_config_path}")
+            self.logger.warning("Traders config not found: %s", self.traders_config_path)
             self.logger.info("Creating default traders.json template...")
             self._create_default_traders_config()
             return []
     
     def _create_default_traders_config(self) -> None:
         """Create default traders.json template"""
-        default_config = {
-            "traders": [
-                {
-                    "address": "0xYOUR_TRADER_ADDRESS_HERE",
-                    "nickname": "Trader1",
-                    "enabled": False,
-                    "copy_buys": True,
-                    "copy_sells": True,
-                    "max_position_size": 500,
-                    "notes": "Add your traders here"
-                }
-            ],
-            "global_settings": {
-                "enabled": True,
-                "copy_delay_seconds": 1,
-                "max_concurrent_trades": 5,
-                "stop_on_error": False
-            }
-        }
-        
-        Path(self.traders_config_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(self.traders_config_path, "w") as f:
-            json.dump(default_config, f, indent=2)
-        
-        self.logger.info(f"Created template at {self.traders_config_path}")
+        config_path = Path(self.traders_config_path)
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        config_path.write_bytes(_DEFAULT_TRADERS_BYTES)
+
+        self.logger.info("Created template at %s", self.traders_config_path)
     
     def _create_monitor(self) -> TraderMonitor:
         """Create trader monitor instance"""
+        from src.trader_monitor import TraderMonitor
+        from src.websocket_client import PolymarketWebSocket
+
+        # WebSocket stream is the primary detection path; polling only
+        # reconciles missed events, so the default interval is slow
+        self._ws = PolymarketWebSocket()
         return TraderMonitor(
             traders=self.traders,
-            poll_interval=float(os.getenv("POLL_INTERVAL", "5")),
-            on_trade_callback=self._on_trade_detected
+            poll_interval=float(os.getenv("POLL_INTERVAL", "60")),
+            on_trade_callback=self._on_trade_detected,
+            ws_client=self._ws
         )
     
     def _create_executor(self) -> OrderExecutor:
         """Create order executor instance"""
+        from src.order_executor import OrderExecutor
+
         return OrderExecutor(
             auth=self.auth,
             copy_config=self.copy_config,
@@ -215,30 +284,42 @@ class CopyTradingBot:
     
     def _on_trade_detected(self, trade: Trade, trader: TraderConfig) -> None:
         """Callback when a new trade is detected"""
-        self._stats["trades_detected"] += 1
-        self._stats["last_activity"] = datetime.now().isoformat()
-        
-        self.logger.info("=" * 60)
-        self.logger.info(f"NEW TRADE DETECTED from {trader.nickname or trade.trader_address[:10]}...")
-        self.logger.info(f"  Market: {trade.title}")
-        self.logger.info(f"  Action: {trade.side} {trade.size:.2f} {trade.outcome} @ ${trade.price:.4f}")
-        self.logger.info(f"  Value: ${trade.usdc_size:.2f}")
-        
-        # Execute copy trade
+        with self._stats_lock:
+            self._stats.trades_detected += 1
+            self._stats.last_activity = time.monotonic_ns()
+
+        # Skip the f-string interpolation entirely when INFO is silenced
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("=" * 60)
+            self.logger.info("NEW TRADE DETECTED from %s...", trader.nickname or trade.trader_address[:10])
+            self.logger.info("  Market: %s", trade.title)
+            self.logger.info("  Action: %s %.2f %s @ $%.4f", trade.side, trade.size, trade.outcome, trade.price)
+            self.logger.info("  Value: $%.2f", trade.usdc_size)
+
+        # Hand execution to the worker pool so detection keeps running
+        # while the order is signed and posted
+        future = self._exec_pool.submit(self.executor.execute_copy_trade, trade, trader)
+        future.add_done_callback(self._record_result)
+
+    def _record_result(self, future: Future) -> None:
+        """Record the outcome of an executed copy trade (worker thread)"""
         try:
-            result = self.executor.execute_copy_trade(trade, trader)
-            
-            if result["success"]:
-                self._stats["trades_executed"] += 1
-                self.logger.info(f"✓ Copy trade executed: ${result['copy_size_usdc']:.2f}")
-            else:
-                self._stats["trades_skipped"] += 1
-                self.logger.info(f"✗ Copy trade skipped: {result.get('reason', result.get('error'))}")
-                
-        except Exception as e:
-            self._stats["errors"] += 1
-            self.logger.error(f"Error executing copy trade: {e}")
-        
+            result = future.result()
+        except Exception:
+            with self._stats_lock:
+                self._stats.errors += 1
+            self.logger.exception("Error executing copy trade")
+            return
+
+        if result["success"]:
+            with self._stats_lock:
+                self._stats.trades_executed += 1
+            self.logger.info("✓ Copy trade executed: $%.2f", result["copy_size_usdc"])
+        else:
+            with self._stats_lock:
+                self._stats.trades_skipped += 1
+            self.logger.info("✗ Copy trade skipped: %s", result.get("reason", result.get("error")))
+
         self.logger.info("=" * 60)
     
     def verify_setup(self) -> bool:
@@ -250,11 +331,11 @@ class CopyTradingBot:
             self.logger.error("No traders configured!")
             return False
         
-        enabled_traders = [t for t in self.traders if t.enabled]
+        enabled_traders = self._enabled_traders
         if not enabled_traders:
             self.logger.warning("No traders enabled! Edit traders.json to enable traders.")
         
-        self.logger.info(f"Traders: {len(self.traders)} total, {len(enabled_traders)} enabled")
+        self.logger.info("Traders: %d total, %d enabled", len(self.traders), len(enabled_traders))
         
         # Check authentication
         try:
@@ -264,16 +345,16 @@ class CopyTradingBot:
                 self.logger.error("✗ Authentication failed")
                 return False
         except Exception as e:
-            self.logger.error(f"✗ Authentication error: {e}")
+            self.logger.error("✗ Authentication error: %s", e)
             return False
         
         # Check copy config
-        self.logger.info(f"Copy mode: {self.copy_config.copy_mode.value}")
-        self.logger.info(f"Amount: ${self.copy_config.amount_to_copy}")
-        self.logger.info(f"Percentage: {self.copy_config.percentage_to_copy}")
-        self.logger.info(f"Order type: {self.copy_config.order_type}")
-        self.logger.info(f"Copy sells: {self.copy_config.copy_sell}")
-        self.logger.info(f"Dry run: {self.dry_run}")
+        self.logger.info("Copy mode: %s", self.copy_config.copy_mode.value)
+        self.logger.info("Amount: $%s", self.copy_config.amount_to_copy)
+        self.logger.info("Percentage: %s", self.copy_config.percentage_to_copy)
+        self.logger.info("Order type: %s", self.copy_config.order_type)
+        self.logger.info("Copy sells: %s", self.copy_config.copy_sell)
+        self.logger.info("Dry run: %s", self.dry_run)
         
         return True
     
@@ -296,59 +377,86 @@ class CopyTradingBot:
         print("\n" + "=" * 50)
         print("BOT STATISTICS")
         print("=" * 50)
-        print(f"  Trades Detected: {self._stats['trades_detected']}")
-        print(f"  Trades Executed: {self._stats['trades_executed']}")
-        print(f"  Trades Skipped:  {self._stats['trades_skipped']}")
-        print(f"  Errors:          {self._stats['errors']}")
-        
-        if self._stats['start_time']:
-            start = datetime.fromisoformat(self._stats['start_time'])
-            elapsed = datetime.now() - start
-            print(f"  Running Time:    {elapsed}")
+        print(f"  Trades Detected: {self._stats.trades_detected}")
+        print(f"  Trades Executed: {self._stats.trades_executed}")
+        print(f"  Trades Skipped:  {self._stats.trades_skipped}")
+        print(f"  Errors:          {self._stats.errors}")
+
+        if self._stats.start_time is not None:
+            elapsed_s = (time.monotonic_ns() - self._stats.start_time) / 1e9
+            print(f"  Started At:      {self._wall_start:%Y-%m-%d %H:%M:%S}")
+            print(f"  Running Time:    {timedelta(seconds=int(elapsed_s))}")
         
         print("=" * 50 + "\n")
     
-    def run(self) -> None:
-        """Run the bot"""
+    async def run_async(self) -> None:
+        """Run the bot on the event loop"""
         self._running = True
-        self._stats["start_time"] = datetime.now().isoformat()
-        
+        self._stats.start_time = time.monotonic_ns()
+        self._wall_start = datetime.now()  # wall clock, display only
+
         self.print_banner()
-        
+
         if not self.verify_setup():
             self.logger.error("Setup verification failed. Exiting.")
             return
-        
-        # Setup signal handlers
-        def signal_handler(signum, frame):
-            self.logger.info("\nReceived shutdown signal...")
-            self._running = False
-            self.print_stats()
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
+
+        # Cooperative shutdown: signals just set an event so in-flight
+        # order submissions finish instead of dying mid-request
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                # Windows: fall back to the sync handler
+                signal.signal(sig, lambda signum, frame: stop.set())
+
         self.logger.info("Starting copy trading bot...")
-        self.logger.info(f"Monitoring {len([t for t in self.traders if t.enabled])} traders")
+        self.logger.info("Monitoring %d traders", len(self._enabled_traders))
         self.logger.info("Press Ctrl+C to stop\n")
-        
-        # Run monitor
+
+        # Run monitor until it exits or a shutdown signal arrives
+        monitor_task = asyncio.ensure_future(self.monitor.run_async())
+        stop_task = asyncio.ensure_future(stop.wait())
         try:
-            self.monitor.run()
-        except Exception as e:
-            self.logger.error(f"Bot error: {e}")
-            import traceback
-            traceback.print_exc()
+            await asyncio.wait(
+                {monitor_task, stop_task},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if monitor_task.done() and monitor_task.exception():
+                raise monitor_task.exception()
+        except Exception:
+            self.logger.exception("Bot error")
         finally:
+            if stop.is_set():
+                self.logger.info("Received shutdown signal, draining...")
             self._running = False
+            stop_task.cancel()
+
+            # Stop the monitor loop, then drain in-flight executions
+            self.monitor.stop()
+            if not monitor_task.done():
+                monitor_task.cancel()
+            if self._ws:
+                await self._ws.close()
+            await asyncio.to_thread(self._exec_pool.shutdown, True)
+
             self.print_stats()
+
+    def run(self) -> None:
+        """Run the bot (blocking)"""
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            pass
     
     def stop(self) -> None:
         """Stop the bot"""
         self._running = False
         if self._monitor:
             self._monitor.stop()
+        self._exec_pool.shutdown(wait=True, cancel_futures=True)
 
 
 def main():
@@ -368,7 +476,8 @@ Examples:
     
     parser.add_argument(
         "--dry-run",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
+        default=False,
         help="Run without executing actual trades"
     )
     
@@ -414,9 +523,17 @@ Examples:
     )
     
     args = parser.parse_args()
-    
-    # Load environment
+
+    # Load environment (dotenv imported here so --help stays fast)
+    from dotenv import load_dotenv
     load_dotenv()
+
+    # uvloop speeds up the socket I/O path 2-4x where available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     # Get required environment variables
     private_key = os.getenv("PRIVATE_KEY")
@@ -434,18 +551,25 @@ Examples:
         sys.exit(1)
     
     # Create copy config
+    from src.order_executor import CopyTradeConfig
     copy_config = CopyTradeConfig.from_env()
     
-    # Override with command line args
-    if args.amount:
-        copy_config.amount_to_copy = args.amount
-        copy_config.percentage_to_copy = None
-    
-    if args.percentage:
-        copy_config.percentage_to_copy = args.percentage
-    
+    # Override with command line args ('is not None' so explicit zero
+    # values aren't silently ignored). The config is frozen, so
+    # overrides build a new instance instead of mutating in place.
+    overrides = {}
+    if args.amount is not None:
+        overrides["amount_to_copy"] = args.amount
+        overrides["percentage_to_copy"] = None
+
+    if args.percentage is not None:
+        overrides["percentage_to_copy"] = args.percentage
+
     if args.order_type:
-        copy_config.order_type = args.order_type
+        overrides["order_type"] = args.order_type
+
+    if overrides:
+        copy_config = dataclasses.replace(copy_config, **overrides)
     
     # Create and run bot
     bot = CopyTradingBot(
@@ -459,7 +583,7 @@ Examples:
         log_file=args.log_file
     )
     
-    bot.run()
+    asyncio.run(bot.run_async())
 
 
 if __name__ == "__main__":
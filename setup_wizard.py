@@ -11,41 +11,128 @@ This script helps you:
 import os
 import sys
 import json
-import shutil
+import functools
 from pathlib import Path
-import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available (native parser, 3-10x faster)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_pretty(obj) -> bytes:
+    """Serialize with 2-space indentation, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# Pooled session for leaderboard/API calls: reuses the TCP+TLS
+# connection across fetches and asks for compressed payloads.
+# Built lazily so code paths that never hit the network skip the
+# requests/urllib3 import cost entirely.
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        _SESSION.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "polymkt-bot/1.0",
+        })
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Parse .env once per run instead of re-reading it on every check"""
+    from dotenv import dotenv_values
+    return dotenv_values(".env")
+
+# Parsed traders.json cache: path -> (mtime_ns, size, data). Keyed on
+# stat so edits invalidate; repeat reads skip the JSON parse entirely.
+_TRADERS_CACHE = {}
+
+
+def load_traders(path):
+    """Load and parse a traders config, cached until the file changes"""
+    path = str(path)
+
+    # Single open + fstat instead of stat-then-open: one syscall less
+    # and no TOCTOU window between the check and the read
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        cached = _TRADERS_CACHE.get(path)
+
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        data = _json_loads(f.read())
+
+    _TRADERS_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 def create_env_file():
     """Create .env file from template"""
     env_path = Path(".env")
     example_path = Path(".env.example")
-    
-    if env_path.exists():
-        print("⚠️  .env file already exists")
-        return False
-    
-    if example_path.exists():
-        shutil.copy(example_path, env_path)
-        print("✓ Created .env file from template")
-        print("  Please edit .env and add your credentials")
-        return True
-    else:
+
+    try:
+        src_fd = os.open(example_path, os.O_RDONLY | os.O_CLOEXEC)
+    except FileNotFoundError:
         print("✗ .env.example not found")
         return False
 
+    try:
+        # O_EXCL folds the existence check into the create itself
+        try:
+            dst_fd = os.open(env_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            print("⚠️  .env file already exists")
+            return False
+
+        try:
+            size = os.fstat(src_fd).st_size
+            if hasattr(os, "sendfile"):
+                # In-kernel copy: no userspace buffer round-trip
+                os.sendfile(dst_fd, src_fd, 0, size)
+            else:
+                os.write(dst_fd, os.read(src_fd, size))
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    print("✓ Created .env file from template")
+    print("  Please edit .env and add your credentials")
+    return True
+
 
 def fetch_leaderboard_traders(limit=20):
     """Fetch top traders from leaderboard"""
     print(f"\nFetching top {limit} traders from Polymarket...")
     
     try:
-        response = requests.get(
+        response = _get_session().get(
             "https://data-api.polymarket.com/leaderboard",
-            params={"limit": limit, "sortBy": "pnl", "timeFrame": "30d"}
+            params={"limit": limit, "sortBy": "pnl", "timeFrame": "30d"},
+            timeout=(3, 10)
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     except Exception as e:
         print(f"✗ Error fetching leaderboard: {e}")
         return []
@@ -53,62 +140,79 @@ def fetch_leaderboard_traders(limit=20):
 
 def display_traders(traders):
     """Display traders in a table"""
-    print("\n" + "=" * 80)
-    print(f"{'#':<4} {'Address':<44} {'PnL (30d)':<15} {'Volume':<15}")
-    print("=" * 80)
-    
-    for i, trader in enumerate(traders[:20]):
-        addr = trader.get("address", trader.get("proxyWallet", ""))
-        pnl = trader.get("pnl", trader.get("totalPnl", 0))
-        vol = trader.get("volume", trader.get("totalVolume", 0))
-        
-        print(f"{i+1:<4} {addr:<44} ${pnl:>12,.2f} ${vol:>12,.2f}")
-    
-    print("=" * 80)
+    rule = "=" * 80
+    top = traders[:20]
+
+    # Normalize each column once (column-wise lists), then format rows
+    # from a zip and emit the whole table in a single write
+    addrs = [t.get("address") or t.get("proxyWallet", "") for t in top]
+    pnls = [t.get("pnl") or t.get("totalPnl", 0) for t in top]
+    vols = [t.get("volume") or t.get("totalVolume", 0) for t in top]
+
+    out = [
+        "",
+        rule,
+        f"{'#':<4} {'Address':<44} {'PnL (30d)':<15} {'Volume':<15}",
+        rule,
+    ]
+    for i, (addr, pnl, vol) in enumerate(zip(addrs, pnls, vols)):
+        out.append(f"{i+1:<4} {addr:<44} ${pnl:>12,.2f} ${vol:>12,.2f}")
+    out.append(rule)
+
+    print("\n".join(out))
+
+
+# Fixed-shape config emitted as rendered text: one f-string per trader
+# row plus a static footer, skipping the dict + pretty-printer roundtrip
+_TRADER_ROW = """    {{
+      "address": "{addr}",
+      "nickname": "TopTrader_{short}",
+      "enabled": false,
+      "copy_buys": true,
+      "copy_sells": true,
+      "max_position_size": 100,
+      "notes": "PnL 30d: ${pnl:,.2f}"
+    }}"""
+
+_TRADERS_FOOTER = """  ],
+  "global_settings": {
+    "enabled": true,
+    "copy_delay_seconds": 1,
+    "max_concurrent_trades": 3,
+    "stop_on_error": false,
+    "notification_webhook": null
+  }
+}"""
 
 
 def create_traders_config(traders, selected_indices=None):
     """Create traders.json with selected traders"""
     config_path = Path("config/traders.json")
-    
+
     if selected_indices is None:
         # Default to top 3
         selected_indices = [0, 1, 2]
-    
+
     selected = [traders[i] for i in selected_indices if i < len(traders)]
-    
-    traders_config = []
+
+    rows = []
     for trader in selected:
         addr = trader.get("address", trader.get("proxyWallet", ""))
         pnl = trader.get("pnl", trader.get("totalPnl", 0))
-        
-        traders_config.append({
-            "address": addr,
-            "nickname": f"TopTrader_{addr[:8]}",
-            "enabled": False,  # Disabled by default for safety
-            "copy_buys": True,
-            "copy_sells": True,
-            "max_position_size": 100,
-            "notes": f"PnL 30d: ${pnl:,.2f}"
-        })
-    
-    config = {
-        "traders": traders_config,
-        "global_settings": {
-            "enabled": True,
-            "copy_delay_seconds": 1,
-            "max_concurrent_trades": 3,
-            "stop_on_error": False,
-            "notification_webhook": None
-        }
-    }
-    
+        # Disabled by default for safety
+        rows.append(_TRADER_ROW.format(addr=addr, short=addr[:8], pnl=pnl))
+
+    content = '{\n  "traders": [\n' + ",\n".join(rows) + "\n" + _TRADERS_FOOTER
+
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-    
-    print(f"\n✓ Created config/traders.json with {len(traders_config)} traders")
+
+    fd = os.open(config_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+
+    print(f"\n✓ Created config/traders.json with {len(rows)} traders")
     print("  Traders are DISABLED by default for safety")
     print("  Edit config/traders.json to enable them")
 
@@ -121,26 +225,26 @@ def verify_configuration():
     
     issues = []
     
-    # Check .env
-    if not Path(".env").exists():
+    # Check .env (open directly instead of a separate exists() stat)
+    try:
+        os.close(os.open(".env", os.O_RDONLY | os.O_CLOEXEC))
+    except FileNotFoundError:
         issues.append("Missing .env file")
     else:
-        # Check required fields
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        if not os.getenv("PRIVATE_KEY"):
+        # Check required fields (parsed once, without touching os.environ)
+        env = _load_env()
+
+        if not env.get("PRIVATE_KEY"):
             issues.append("PRIVATE_KEY not set in .env")
-        if not os.getenv("FUNDER_ADDRESS"):
+        if not env.get("FUNDER_ADDRESS"):
             issues.append("FUNDER_ADDRESS not set in .env")
-    
+
     # Check traders.json
-    if not Path("config/traders.json").exists():
+    try:
+        config = load_traders("config/traders.json")
+    except FileNotFoundError:
         issues.append("Missing config/traders.json")
     else:
-        with open("config/traders.json") as f:
-            config = json.load(f)
-        
         enabled = [t for t in config.get("traders", []) if t.get("enabled")]
         if not enabled:
             issues.append("No traders enabled in config/traders.json")
@@ -7,23 +7,78 @@ Handles:
 - Credential derivation and storage
 """
 
+from __future__ import annotations
+
 import os
+import hmac
 import json
 import time
-from typing import Optional, Dict, Any
+import base64
+import hashlib
+import logging
+import functools
+from typing import Optional, Dict, Any, TYPE_CHECKING, final
 from dataclasses import dataclass
 from pathlib import Path
 
-try:
+if TYPE_CHECKING:
     from py_clob_client.client import ClobClient
     from py_clob_client.clob_types import ApiCreds
+
+logger = logging.getLogger(__name__)
+
+# Parsed credentials keyed by path -> (mtime_ns, ApiCreds); invalidated
+# automatically when the file is rewritten
+_CREDS_CACHE: Dict[str, tuple] = {}
+
+try:
+    import orjson
 except ImportError:
-    print("Installing py-clob-client...")
-    os.system("pip install py-clob-client")
-    from py_clob_client.client import ClobClient
-    from py_clob_client.clob_types import ApiCreds
+    orjson = None
+
+
+@functools.lru_cache(maxsize=1)
+def _clob_imports():
+    """
+    Import py-clob-client on first use
+
+    The library drags in the eth crypto stack (~300ms, tens of MB), so
+    credential-parsing-only callers never pay for it.
+    """
+    try:
+        from py_clob_client.client import ClobClient
+        from py_clob_client.clob_types import ApiCreds
+    except ImportError:
+        raise ImportError(
+            "py-clob-client is required: pip install -r requirements.txt"
+        ) from None
+    return ClobClient, ApiCreds
 
 
+@functools.lru_cache(maxsize=2)
+def _client_has(method: str) -> bool:
+    """Capability probe resolved once: the installed py-clob-client
+    version is fixed for the life of the process, so hasattr checks
+    against the class don't need to repeat per call"""
+    ClobClient, _ = _clob_imports()
+    return hasattr(ClobClient, method)
+
+
+def _json_loads(data):
+    """Parse JSON bytes with orjson when available (C parser)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_pretty(obj) -> bytes:
+    """Serialize with 2-space indentation, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+@final
 class PolymarketAuth:
     """
     Handles Polymarket authentication (L1 and L2)
@@ -41,6 +96,18 @@ class PolymarketAuth:
     CLOB_HOST = "https://clob.polymarket.com"
     CHAIN_ID = 137  # Polygon mainnet
     CREDENTIALS_FILE = "credentials.json"
+    # How long a successful verification is trusted before the server
+    # is probed again (seconds, tunable via POLYMARKET_CREDS_TTL)
+    VERIFY_TTL = 600
+
+    # Fixed attribute layout: no per-instance __dict__, faster lookups
+    __slots__ = (
+        "private_key", "_key_bytes", "funder_address", "signature_type",
+        "creds_dir", "creds_file", "creds_meta_file", "_verify_ttl",
+        "pre_existing_creds",
+        "_client", "_client_creds_key", "_l1_client", "_readonly_client",
+        "_credentials", "_hmac_template",
+    )
     
     def __init__(
         self,
@@ -64,16 +131,25 @@ class PolymarketAuth:
             api_secret: Pre-existing API secret (from .env)
             api_passphrase: Pre-existing API passphrase (from .env)
         """
-        # Ensure proper format
-        self.private_key = private_key if private_key.startswith('0x') else '0x' + private_key
+        # Decode the key once: validates the hex up front (bytes.fromhex
+        # raises on malformed input) and gives every downstream client
+        # the same canonical 0x-prefixed lowercase form
+        try:
+            self._key_bytes = bytes.fromhex(private_key.removeprefix('0x'))
+        except ValueError:
+            raise ValueError("PRIVATE_KEY is not valid hex") from None
+        self.private_key = '0x' + self._key_bytes.hex()
         self.funder_address = funder_address if funder_address.startswith('0x') else '0x' + funder_address
         self.signature_type = signature_type
         self.creds_dir = Path(creds_dir)
         self.creds_file = self.creds_dir / self.CREDENTIALS_FILE
+        self.creds_meta_file = self.creds_dir / (self.CREDENTIALS_FILE + ".meta")
+        self._verify_ttl = float(os.getenv("POLYMARKET_CREDS_TTL", self.VERIFY_TTL))
         
         # Pre-existing credentials from .env
         self.pre_existing_creds = None
         if api_key and api_secret and api_passphrase:
+            _, ApiCreds = _clob_imports()
             self.pre_existing_creds = ApiCreds(
                 api_key=api_key,
                 api_secret=api_secret,
@@ -81,21 +157,61 @@ class PolymarketAuth:
             )
         
         self._client: Optional[ClobClient] = None
+        self._client_creds_key = None
+        self._l1_client: Optional[ClobClient] = None
+        self._readonly_client: Optional[ClobClient] = None
         self._credentials: Optional[ApiCreds] = None
+        self._hmac_template = None
+
+    def _get_l1_client(self) -> ClobClient:
+        """
+        Get the L1-auth client, building it on first use
+
+        The ClobClient constructor re-derives the signing key and opens a
+        fresh HTTP session, so the same instance is reused across the
+        create/derive credential paths. The identity fields it is keyed
+        on (private key, chain, signature type, funder) never change
+        after __init__.
+        """
+        if self._l1_client is None:
+            ClobClient, _ = _clob_imports()
+            self._l1_client = ClobClient(
+                host=self.CLOB_HOST,
+                key=self.private_key,
+                chain_id=self.CHAIN_ID,
+                signature_type=self.signature_type,
+                funder=self.funder_address
+            )
+        return self._l1_client
     
     def _load_credentials(self) -> Optional[ApiCreds]:
-        """Load credentials from file if they exist"""
-        if self.creds_file.exists():
-            try:
-                with open(self.creds_file, "r") as f:
-                    data = json.load(f)
-                return ApiCreds(
-                    api_key=data.get("api_key", data.get("apiKey", "")),
-                    api_secret=data.get("api_secret", data.get("secret", "")),
-                    api_passphrase=data.get("api_passphrase", data.get("passphrase", ""))
-                )
-            except Exception as e:
-                print(f"Warning: Could not load credentials: {e}")
+        """Load credentials from file if they exist, cached until it changes"""
+        key = str(self.creds_file)
+        try:
+            # EAFP open + fstat on the handle: no separate exists() stat
+            # and no TOCTOU window; the mtime key means a steady-state
+            # reload costs one fstat instead of a read + JSON parse
+            with open(self.creds_file, "rb") as f:
+                st = os.fstat(f.fileno())
+                cached = _CREDS_CACHE.get(key)
+                if cached is not None and cached[0] == st.st_mtime_ns:
+                    return cached[1]
+                data = _json_loads(f.read())
+
+            _, ApiCreds = _clob_imports()
+            # `or` short-circuits: files we wrote ourselves resolve
+            # each field in one probe, legacy camelCase in two
+            creds = ApiCreds(
+                api_key=data.get("api_key") or data.get("apiKey", ""),
+                api_secret=data.get("api_secret") or data.get("secret", ""),
+                api_passphrase=data.get("api_passphrase") or data.get("passphrase", "")
+            )
+            _CREDS_CACHE[key] = (st.st_mtime_ns, creds)
+            return creds
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not load credentials: %s", e)
         return None
     
     def _save_credentials(self, creds: ApiCreds) -> None:
@@ -107,10 +223,16 @@ class PolymarketAuth:
             "api_passphrase": creds.api_passphrase,
             "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
         }
-        with open(self.creds_file, "w") as f:
-            json.dump(data, f, indent=2)
-        # Set restrictive permissions
-        os.chmod(self.creds_file, 0o600)
+        # Write to a temp file with 0o600 applied at create (no window
+        # where the secrets are world-readable), then atomically swap it
+        # in so readers never see a partial file
+        tmp_path = str(self.creds_file) + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o600)
+        try:
+            os.write(fd, _json_dumps_pretty(data))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.creds_file)
     
     def get_credentials(self) -> ApiCreds:
         """
@@ -126,42 +248,36 @@ class PolymarketAuth:
         """
         # 1. Use pre-existing from .env
         if self.pre_existing_creds:
-            print("Using API credentials from .env")
+            logger.info("Using API credentials from .env")
             self._credentials = self.pre_existing_creds
             return self._credentials
         
         # 2. Try stored credentials
         stored = self._load_credentials()
         if stored:
-            print("Using stored credentials from credentials.json")
+            logger.info("Using stored credentials from credentials.json")
             self._credentials = stored
             return self._credentials
         
         # 3. Derive from Polymarket
-        print("Deriving API credentials from Polymarket...")
+        logger.info("Deriving API credentials from Polymarket...")
         return self.derive_credentials()
     
     def derive_credentials(self) -> ApiCreds:
         """Derive API credentials from Polymarket using L1 auth"""
-        client = ClobClient(
-            host=self.CLOB_HOST,
-            key=self.private_key,
-            chain_id=self.CHAIN_ID,
-            signature_type=self.signature_type,
-            funder=self.funder_address
-        )
-        
+        client = self._get_l1_client()
+
         # Try create_or_derive first (handles both cases)
-        if hasattr(client, 'create_or_derive_api_creds'):
+        if _client_has('create_or_derive_api_creds'):
             creds = client.create_or_derive_api_creds()
         else:
             # Try derive first, then create
             try:
                 creds = client.derive_api_key()
-                print("Derived existing API credentials")
+                logger.info("Derived existing API credentials")
             except Exception:
                 creds = client.create_api_key()
-                print("Created new API credentials")
+                logger.info("Created new API credentials")
         
         self._save_credentials(creds)
         self._credentials = creds
@@ -169,14 +285,8 @@ class PolymarketAuth:
     
     def create_credentials(self) -> ApiCreds:
         """Create new API credentials (forces new creation)"""
-        client = ClobClient(
-            host=self.CLOB_HOST,
-            key=self.private_key,
-            chain_id=self.CHAIN_ID,
-            signature_type=self.signature_type,
-            funder=self.funder_address
-        )
-        
+        client = self._get_l1_client()
+
         creds = client.create_api_key()
         self._save_credentials(creds)
         self._credentials = creds
@@ -190,8 +300,22 @@ class PolymarketAuth:
             ClobClient instance ready for L2 operations
         """
         creds = self._credentials or self.get_credentials()
-        
+
+        # Reuse the cached client while the credentials are unchanged
+        creds_key = (creds.api_key, creds.api_secret, creds.api_passphrase)
+        if self._client is not None and self._client_creds_key == creds_key:
+            return self._client
+
+        # If the derive path already built an L1 client, promote it to
+        # L2 instead of re-running key parsing + session setup
+        if self._l1_client is not None and _client_has("set_api_creds"):
+            self._l1_client.set_api_creds(creds)
+            self._client = self._l1_client
+            self._client_creds_key = creds_key
+            return self._client
+
         # Create client with L2 credentials
+        ClobClient, _ = _clob_imports()
         client = ClobClient(
             host=self.CLOB_HOST,
             key=self.private_key,
@@ -200,30 +324,101 @@ class PolymarketAuth:
             signature_type=self.signature_type,
             funder=self.funder_address
         )
-        
+
         self._client = client
+        self._client_creds_key = creds_key
         return client
     
     def get_readonly_client(self) -> ClobClient:
         """
         Get read-only CLOB client (no authentication required)
-        
+
+        Cached: poll loops hitting read-only endpoints reuse one client
+        (and its keep-alive connections) instead of re-handshaking TLS.
+
         Returns:
             ClobClient instance for read-only operations
         """
-        return ClobClient(host=self.CLOB_HOST)
+        if self._readonly_client is None:
+            ClobClient, _ = _clob_imports()
+            self._readonly_client = ClobClient(host=self.CLOB_HOST)
+        return self._readonly_client
     
+    @staticmethod
+    def _creds_fingerprint(creds: ApiCreds) -> str:
+        """Short non-secret fingerprint identifying a credential set"""
+        # blake2b: faster than sha256 and not security-critical here
+        return hashlib.blake2b(
+            (creds.api_key + creds.api_secret).encode(), digest_size=8
+        ).hexdigest()
+
     def verify_connection(self) -> bool:
-        """Verify the connection and credentials are working"""
+        """
+        Verify the connection and credentials are working
+
+        A successful probe is recorded in a sidecar next to
+        credentials.json; warm restarts within the TTL skip the
+        get_server_time round trip entirely.
+        """
         try:
+            fingerprint = self._creds_fingerprint(self.credentials)
+
+            try:
+                with open(self.creds_meta_file, "r") as f:
+                    meta = json.load(f)
+                if (meta.get("fingerprint") == fingerprint
+                        and time.time() - meta.get("validated_at", 0) < self._verify_ttl):
+                    logger.info("Credentials verified recently, skipping CLOB probe")
+                    return True
+            except (FileNotFoundError, ValueError):
+                pass
+
+            # Credentials written in the last minute were just derived
+            # against the live server; probing again proves nothing
+            try:
+                if time.time() - self.creds_file.stat().st_mtime < 60:
+                    logger.info("Credentials freshly derived, skipping CLOB probe")
+                    return True
+            except OSError:
+                pass
+
             client = self.get_trading_client()
             server_time = client.get_server_time()
-            print(f"✓ Connected to CLOB. Server time: {server_time}")
+            logger.info("Connected to CLOB. Server time: %s", server_time)
+
+            try:
+                with open(self.creds_meta_file, "w") as f:
+                    json.dump({"validated_at": time.time(),
+                               "fingerprint": fingerprint}, f)
+            except OSError:
+                pass  # Sidecar is an optimization; never fail on it
+
             return True
         except Exception as e:
-            print(f"✗ Connection failed: {e}")
+            logger.error("Connection failed: %s", e)
             return False
     
+    def sign_l2(self, timestamp: str, method: str, path: str, body: str = "") -> str:
+        """
+        Compute an L2 HMAC-SHA256 signature for a direct REST call
+
+        The HMAC key schedule (two 64-byte padded key blocks plus one
+        SHA-256 compression) is built once from the api_secret and
+        copied per call, so each signature costs only the message hash.
+        """
+        if self._hmac_template is None:
+            secret = base64.urlsafe_b64decode(self.credentials.api_secret)
+            self._hmac_template = hmac.new(secret, digestmod=hashlib.sha256)
+
+        h = self._hmac_template.copy()
+        h.update(f"{timestamp}{method}{path}{body}".encode())
+        return base64.urlsafe_b64encode(h.digest()).decode()
+
+    async def verify_connection_async(self) -> bool:
+        """Async wrapper over verify_connection (runs in a worker thread)"""
+        import asyncio
+        return await asyncio.to_thread(self.verify_connection)
+
     @property
     def client(self) -> ClobClient:
         """Get the current client, initializing if necessary"""
@@ -239,32 +434,64 @@ class PolymarketAuth:
         return self._credentials
 
 
+async def verify_many(auths) -> list:
+    """
+    Verify several auth handlers concurrently
+
+    Multi-account setups pay one wall-clock round trip instead of one
+    per account; each handler still uses its own cached client.
+    """
+    import asyncio
+    return list(await asyncio.gather(
+        *(auth.verify_connection_async() for auth in auths)
+    ))
+
+
+_DOTENV_LOADED = False
+
+
+def _load_dotenv_once() -> None:
+    """Run load_dotenv's .env search at most once per process"""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        # load_dotenv only fills in variables that aren't already set,
+        # so mixed setups (PRIVATE_KEY exported in the shell, the rest
+        # in .env) still pick up the file
+        from dotenv import load_dotenv
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+@functools.cache
 def setup_auth_from_env() -> PolymarketAuth:
     """
     Create PolymarketAuth instance from environment variables
-    
+
+    Memoized: repeat callers share one handler (and its cached clients)
+    instead of re-walking the filesystem for .env each time.
+
     Required env vars:
     - PRIVATE_KEY: Wallet private key
     - FUNDER_ADDRESS: Proxy wallet address
     - SIGNATURE_TYPE: 0, 1, or 2
-    
+
     Optional env vars (if provided, skip derivation):
     - POLY_API_KEY: API key
     - POLY_API_SECRET: API secret
     - POLY_API_PASSPHRASE: API passphrase
     """
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    private_key = os.getenv("PRIVATE_KEY")
-    funder_address = os.getenv("FUNDER_ADDRESS")
-    signature_type = int(os.getenv("SIGNATURE_TYPE", "1"))
-    
+    _load_dotenv_once()
+
+    env = os.environ.get
+    private_key = env("PRIVATE_KEY")
+    funder_address = env("FUNDER_ADDRESS")
+    signature_type = int(env("SIGNATURE_TYPE", "1"))
+
     # Optional pre-existing credentials
-    api_key = os.getenv("POLY_API_KEY")
-    api_secret = os.getenv("POLY_API_SECRET")
-    api_passphrase = os.getenv("POLY_API_PASSPHRASE")
-    
+    api_key = env("POLY_API_KEY")
+    api_secret = env("POLY_API_SECRET")
+    api_passphrase = env("POLY_API_PASSPHRASE")
+
     if not private_key:
         raise ValueError("PRIVATE_KEY not set in environment. Run setup.py first!")
     if not funder_address:
@@ -13,26 +13,33 @@ Order type behavior:
         until filled. Auto-cancels after GTC_TIMEOUT_SECONDS if not filled.
 """
 
+import concurrent.futures
+import functools
+import heapq
+import logging
+import math
 import os
 import time
 import threading
 from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from decimal import Decimal, ROUND_DOWN
 
 try:
     from py_clob_client.client import ClobClient
     from py_clob_client.clob_types import OrderArgs, MarketOrderArgs, OrderType
-except ImportError:
-    print("Installing py-clob-client...")
-    os.system("pip install py-clob-client")
-    from py_clob_client.client import ClobClient
-    from py_clob_client.clob_types import OrderArgs, MarketOrderArgs, OrderType
-
-from auth import PolymarketAuth
+except ImportError as e:
+    # Fail fast with a clear message instead of forking pip at import
+    # time; installs belong to the operator, not the hot path
+    raise ImportError(
+        "py-clob-client is required: pip install -r requirements.txt"
+    ) from e
+
+from auth import PolymarketAuth, _load_dotenv_once
 from trader_monitor import Trade, TraderConfig, GammaAPIClient
 
+logger = logging.getLogger(__name__)
+
 
 class CopyMode(Enum):
     """Copy trade sizing mode"""
@@ -40,9 +47,28 @@ class CopyMode(Enum):
     PERCENTAGE   = "percentage"
 
 
-@dataclass
+@functools.lru_cache(maxsize=4)
+def _coerce_env_config(
+    amount: str, pct: str, copy_sell: str, order_type: str,
+    min_size: str, max_size: str, gtc_timeout: str
+) -> Tuple:
+    """Coerce raw env strings once; keyed on the values actually read."""
+    percentage = None if pct.lower() == "null" else float(pct)
+    return (
+        float(amount),
+        percentage,
+        copy_sell.lower() == "true",
+        order_type.upper(),
+        float(min_size),
+        float(max_size),
+        int(gtc_timeout),
+    )
+
+
+@dataclass(frozen=True)
 class CopyTradeConfig:
-    """Configuration for copy trading behavior"""
+    """Configuration for copy trading behavior (immutable; derive
+    variants with dataclasses.replace)"""
     amount_to_copy:      float           = 50.0
     percentage_to_copy:  Optional[float] = 100.0
     copy_sell:           bool            = True
@@ -51,89 +77,125 @@ class CopyTradeConfig:
     max_trade_size:      float           = 1000.0
     gtc_timeout_seconds: int             = 60         # auto-cancel GTC after N seconds
 
+    # Derived scalars frozen at construction so the per-trade hot path
+    # does plain attribute reads instead of recomputing divisions
+    _pct_fraction: float    = field(init=False, repr=False, compare=False, default=0.0)
+    _mode:         CopyMode = field(init=False, repr=False, compare=False,
+                                    default=None)  # type: ignore[assignment]
+
+    def __post_init__(self):
+        object.__setattr__(self, "_pct_fraction", (self.percentage_to_copy or 0) / 100.0)
+        object.__setattr__(
+            self,
+            "_mode",
+            CopyMode.FIXED_AMOUNT if self.percentage_to_copy is None else CopyMode.PERCENTAGE,
+        )
+
     @classmethod
     def from_env(cls) -> "CopyTradeConfig":
-        from dotenv import load_dotenv
-        load_dotenv()
-
-        pct_str    = os.getenv("PERCENTAGE_TO_COPY", "100")
-        percentage = None if pct_str.lower() == "null" else float(pct_str)
-
-        return cls(
-            amount_to_copy      = float(os.getenv("AMOUNT_TO_COPY",        "50")),
-            percentage_to_copy  = percentage,
-            copy_sell           = os.getenv("COPY_SELL", "true").lower() == "true",
-            order_type          = os.getenv("TYPE_ORDER", "FOK").upper(),
-            min_trade_size      = float(os.getenv("MIN_TRADE_SIZE",         "1")),
-            max_trade_size      = float(os.getenv("MAX_TRADE_SIZE",         "1000")),
-            gtc_timeout_seconds = int(os.getenv("GTC_TIMEOUT_SECONDS",     "60")),
+        # Shares the process-wide dotenv guard with the auth module, so
+        # repeat constructions never re-stat or re-parse .env
+        _load_dotenv_once()
+
+        # Coercion is memoised on the raw env strings, so repeat calls
+        # (bot __init__, executor __init__, main) parse each value once
+        values = _coerce_env_config(
+            os.getenv("AMOUNT_TO_COPY",       "50"),
+            os.getenv("PERCENTAGE_TO_COPY",   "100"),
+            os.getenv("COPY_SELL",            "true"),
+            os.getenv("TYPE_ORDER",           "FOK"),
+            os.getenv("MIN_TRADE_SIZE",       "1"),
+            os.getenv("MAX_TRADE_SIZE",       "1000"),
+            os.getenv("GTC_TIMEOUT_SECONDS",  "60"),
         )
+        return cls(*values)
 
     @property
     def copy_mode(self) -> CopyMode:
-        if self.percentage_to_copy is None:
-            return CopyMode.FIXED_AMOUNT
-        return CopyMode.PERCENTAGE
+        return self._mode
 
 
-# ── Decimal rounding helper ────────────────────────────────────────────────────
+# ── Fixed-point rounding helpers ───────────────────────────────────────────────
+#
+# All CLOB quantities live on small fixed grids — price/size in 1/10000
+# units ("ticks"), maker amount in cents — so the search runs in plain
+# int arithmetic. The old Decimal version allocated ~3 Decimals per loop
+# step; this is a handful of C-level int ops per step.
 
-def _safe_order_params(price: float, copy_size: float, tick_size) -> Tuple[float, float]:
+@functools.lru_cache(maxsize=2048)
+def _params_impl(price_ticks: int, budget_cents: int) -> Tuple[float, float]:
+    """
+    Solve for (price, size) on the integer grids; memoized
+
+    A maker amount m (cents) is representable exactly at 2dp iff
+    price_ticks divides m * 10^6, i.e. iff m is a multiple of
+    price_ticks // gcd(price_ticks, 10^6). The largest such m within
+    the budget is one modulo away — no search needed. The window of
+    200 cents below budget matches the old iterative bound: rather
+    than deviate more than $2 from the intended copy amount, fall
+    back to the minimum viable order.
+    """
+    step = price_ticks // math.gcd(price_ticks, 1_000_000)
+    maker_cents = budget_cents - (budget_cents % step)
+    if maker_cents > 0 and budget_cents - maker_cents < 200:
+        # size (1e-4 units) = maker_usdc / price, exact by construction
+        size_units = (maker_cents * 1_000_000) // price_ticks
+        return price_ticks / 10000.0, size_units / 10000.0
+
+    size_units = max(1, 1_000_000 // price_ticks)
+    return price_ticks / 10000.0, size_units / 10000.0
+
+
+# Tick size arrives from the API as a short string ("0.01", "0.001");
+# pre-seed the common values and memoize the rest so the hot path is a
+# dict hit instead of a float parse per order
+_TICK_CACHE = {"0.01": 100, "0.001": 10, "0.1": 1000, "0.0001": 1}
+
+
+def _tick_to_ticks(tick_size) -> int:
+    ticks = _TICK_CACHE.get(tick_size)
+    if ticks is None:
+        ticks = int(float(tick_size) * 10000 + 0.5)
+        if isinstance(tick_size, str):
+            _TICK_CACHE[tick_size] = ticks
+    return ticks
+
+
+def _int_order_params(price: float, copy_size: float, tick_size) -> Tuple[float, float]:
     """
     Return (price, size) guaranteed to satisfy Polymarket CLOB constraints:
 
         makerAmount = price * size  → MAX 2 decimal places
         takerAmount = size          → MAX 4 decimal places
 
-    Iterates maker_cents downward from budget until price_d * size_d == maker_d
-    exactly at 2dp precision. Converges within ≤ 200 steps.
+    Floors price to the tick grid and clamps to [0.01, 0.99], then walks
+    maker_cents downward from the budget until floor(price * size) at 2dp
+    equals maker exactly. Converges within ≤ 200 steps.
     """
-    tick_d  = Decimal(str(float(tick_size)))
-    price_d = Decimal(str(price)).quantize(tick_d, rounding=ROUND_DOWN)
-    price_d = max(Decimal("0.01"), min(price_d, Decimal("0.99")))
+    # Scale to integer grids; the epsilon absorbs float representation
+    # error without disturbing values genuinely below a grid line
+    tick_ticks  = _tick_to_ticks(tick_size)
+    price_ticks = int(price * 10000 + 1e-6)
+    price_ticks = (price_ticks // tick_ticks) * tick_ticks
+    price_ticks = max(100, min(price_ticks, 9900))
 
-    budget_d     = Decimal(str(copy_size)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-    budget_cents = int(budget_d * 100)
+    return _params_impl(price_ticks, int(copy_size * 100 + 1e-6))
 
-    for maker_cents in range(budget_cents, max(0, budget_cents - 200), -1):
-        maker_d = Decimal(maker_cents) / Decimal("100")
-        size_d  = (maker_d / price_d).quantize(Decimal("0.0001"), rounding=ROUND_DOWN)
-        if size_d <= Decimal("0"):
-            continue
-        if (price_d * size_d).quantize(Decimal("0.01"), rounding=ROUND_DOWN) == maker_d:
-            return float(price_d), float(size_d)
 
-    size_d = (Decimal("0.01") / price_d).quantize(Decimal("0.0001"), rounding=ROUND_DOWN)
-    return float(price_d), float(max(size_d, Decimal("0.0001")))
+def _safe_order_params(price: float, copy_size: float, tick_size) -> Tuple[float, float]:
+    """(price, size) for FOK/FAK orders; caller pre-applies slippage."""
+    return _int_order_params(price, copy_size, tick_size)
 
 
 def _gtc_order_params(price: float, copy_size: float, tick_size) -> Tuple[float, float]:
     """
     Return (price, size) for a GTC order at the EXACT original price.
 
-    Unlike _safe_order_params (which adds slippage), this snaps price to the
-    nearest tick WITHOUT adding any buffer — preserving the trader's exact
-    entry price.  The same 2dp/4dp decimal constraints still apply.
+    Unlike the FOK/FAK path (where the caller adds slippage), the raw
+    trade price is snapped to the tick grid with no buffer — preserving
+    the trader's exact entry price. Same 2dp/4dp constraints apply.
     """
-    tick_d  = Decimal(str(float(tick_size)))
-    # Snap to nearest tick (round, not floor) to stay as close as possible
-    price_d = (Decimal(str(price)) / tick_d).to_integral_value(
-                  rounding=ROUND_DOWN) * tick_d
-    price_d = max(Decimal("0.01"), min(price_d, Decimal("0.99")))
-
-    budget_d     = Decimal(str(copy_size)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-    budget_cents = int(budget_d * 100)
-
-    for maker_cents in range(budget_cents, max(0, budget_cents - 200), -1):
-        maker_d = Decimal(maker_cents) / Decimal("100")
-        size_d  = (maker_d / price_d).quantize(Decimal("0.0001"), rounding=ROUND_DOWN)
-        if size_d <= Decimal("0"):
-            continue
-        if (price_d * size_d).quantize(Decimal("0.01"), rounding=ROUND_DOWN) == maker_d:
-            return float(price_d), float(size_d)
-
-    size_d = (Decimal("0.01") / price_d).quantize(Decimal("0.0001"), rounding=ROUND_DOWN)
-    return float(price_d), float(max(size_d, Decimal("0.0001")))
+    return _int_order_params(price, copy_size, tick_size)
 
 
 # ── Order Executor ─────────────────────────────────────────────────────────────
@@ -159,19 +221,85 @@ class OrderExecutor:
         self.dry_run     = dry_run
 
         self._client: Optional[ClobClient] = None
+        self._client_lock = threading.Lock()
         self.gamma_api = GammaAPIClient()
 
+        # condition_id -> (fetched_at, market_info); see get_market_info.
+        # Plain dict: worst case under a race is a duplicate fetch.
+        self._market_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Small I/O pool used to overlap the Gamma metadata fetch with
+        # the local size/validation work in execute_copy_trade
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="executor-io")
+
         self.executed_trades: list = []
         self.failed_trades:   list = []
 
-        # Track open GTC orders for timeout management: {order_id: cancel_timer}
-        self._gtc_timers: Dict[str, threading.Timer] = {}
+        # GTC timeout management: one expiry thread draining a min-heap
+        # of (deadline, order_id) instead of a threading.Timer (a whole
+        # OS thread + stack) per open order. Cancelled orders are
+        # removed lazily from the heap via the pending set.
+        self._gtc_heap: list = []
+        self._gtc_pending: set = set()
+        self._gtc_lock = threading.Lock()
+        self._gtc_wakeup = threading.Event()
+        self._gtc_thread: Optional[threading.Thread] = None
+
+        # Which response key carries the order id; learned from the
+        # first response so later orders probe one key, not three
+        self._order_id_key: Optional[str] = None
+
+        # Order-type dispatch: one dict hit replaces the string-compare
+        # chains in execute_copy_trade. Price fns share a signature;
+        # place fns take (token_id, price, size, side, copy_size) with
+        # FOK/GTC ignoring the trailing budget.
+        self._dispatch = {
+            "GTC": (self._gtc_price_size,
+                    lambda tok, p, s, sd, _sz: self._place_gtc_order(tok, p, s, sd)),
+            "FAK": (self._slip_price_size, self._place_fak_order),
+            "FOK": (self._slip_price_size,
+                    lambda tok, p, s, sd, _sz: self._place_fok_order(tok, p, s, sd)),
+        }
 
     @property
     def client(self) -> ClobClient:
-        if self._client is None:
-            self._client = self.auth.get_trading_client()
-        return self._client
+        # Lazy so dry-run never derives API creds; double-checked lock
+        # so the trading thread and GTC expiry thread can't each build
+        # a client. The fast path is one load + one is-None branch.
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self.auth.get_trading_client()
+                    self._configure_client_session(client)
+                    self._client = client
+        return client
+
+    @staticmethod
+    def _configure_client_session(client) -> None:
+        """
+        Mount a pooled keep-alive adapter on the client's HTTP session
+        so successive CLOB calls reuse one TLS connection instead of
+        paying a handshake each. Best effort: py-clob-client versions
+        that issue bare requests (no session attribute) are left alone.
+        """
+        session = getattr(client, "session", None)
+        if session is None or not hasattr(session, "mount"):
+            return
+        try:
+            from requests.adapters import HTTPAdapter, Retry
+
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1,
+                                  status_forcelist=[502, 503, 504]),
+            ))
+            session.headers["Connection"] = "keep-alive"
+        except Exception as e:
+            logger.debug("[Executor] Could not tune CLOB session: %s", e)
 
     # ── Size calculator ────────────────────────────────────────────────────────
 
@@ -191,12 +319,11 @@ class OrderExecutor:
             if original_trade.side == "SELL" and not trader_config.copy_sells:
                 return 0.0, "SELL orders not copied for this trader"
 
-        if config.copy_mode == CopyMode.FIXED_AMOUNT:
+        if config._mode is CopyMode.FIXED_AMOUNT:
             size   = config.amount_to_copy
             reason = f"Fixed amount: ${size:.2f}"
         else:
-            pct    = config.percentage_to_copy / 100.0
-            size   = original_trade.usdc_size * pct
+            size   = original_trade.usdc_size * config._pct_fraction
             reason = f"{config.percentage_to_copy}% of ${original_trade.usdc_size:.2f} = ${size:.2f}"
 
         if size < config.min_trade_size:
@@ -214,60 +341,126 @@ class OrderExecutor:
 
     # ── Market info ────────────────────────────────────────────────────────────
 
+    MARKET_INFO_TTL = 300  # tick size / neg_risk are effectively static
+
     def get_market_info(self, condition_id: str) -> Optional[Dict[str, Any]]:
+        # TTL cache: repeat trades on the same market skip the Gamma
+        # round-trip, usually the dominant latency in the copy path.
+        # Errors and None results are not cached, so transient failures
+        # retry on the next trade. Only the two fields the executor
+        # reads are retained, not the full market payload.
+        now = time.monotonic()
+        cached = self._market_cache.get(condition_id)
+        if cached is not None and now - cached[0] < self.MARKET_INFO_TTL:
+            return cached[1]
+
         try:
-            return self.gamma_api.get_market_by_condition_id(condition_id)
+            info = self.gamma_api.get_market_by_condition_id(condition_id)
         except Exception as e:
-            print(f"[Executor] Error getting market info: {e}")
+            logger.warning("[Executor] Error getting market info: %s", e)
             return None
 
+        if info is not None:
+            self._market_cache[condition_id] = (now, {
+                "minimum_tick_size": info.get("minimum_tick_size", "0.01"),
+                "neg_risk":          info.get("neg_risk", False),
+            })
+        return info
+
     # ── GTC timeout / auto-cancel ──────────────────────────────────────────────
 
+    def _ensure_gtc_thread(self) -> None:
+        """Start the expiry thread on first GTC order."""
+        if self._gtc_thread is None:
+            self._gtc_thread = threading.Thread(
+                target=self._gtc_expiry_loop, name="gtc-expiry", daemon=True)
+            self._gtc_thread.start()
+
+    def _gtc_expiry_loop(self) -> None:
+        """Drain expired GTC orders; sleeps until the earliest deadline."""
+        while True:
+            with self._gtc_lock:
+                # Drop heap entries whose orders were cancelled manually
+                while self._gtc_heap and self._gtc_heap[0][1] not in self._gtc_pending:
+                    heapq.heappop(self._gtc_heap)
+                wait = (self._gtc_heap[0][0] - time.time()) if self._gtc_heap else None
+
+            if wait is None or wait > 0:
+                self._gtc_wakeup.wait(timeout=wait)
+                self._gtc_wakeup.clear()
+                continue
+
+            with self._gtc_lock:
+                if not self._gtc_heap or self._gtc_heap[0][0] > time.time():
+                    continue
+                _, order_id = heapq.heappop(self._gtc_heap)
+                live = order_id in self._gtc_pending
+                self._gtc_pending.discard(order_id)
+
+            if live:
+                logger.info("[Executor][GTC] Timeout reached for order %s — cancelling...", order_id)
+                try:
+                    self.client.cancel(order_id)
+                    logger.info("[Executor][GTC] Order %s cancelled successfully.", order_id)
+                except Exception as e:
+                    logger.warning("[Executor][GTC] Cancel failed for %s: %s", order_id, e)
+
     def _schedule_gtc_cancel(self, order_id: str, timeout: int) -> None:
         """
         Schedule an automatic cancel for a GTC order after `timeout` seconds.
-        Runs in a background thread so it never blocks the main loop.
+        Handled by the shared expiry thread so it never blocks the main loop.
         """
-        def _cancel():
-            print(f"[Executor][GTC] Timeout reached for order {order_id} — cancelling...")
-            try:
-                self.client.cancel(order_id)
-                print(f"[Executor][GTC] Order {order_id} cancelled successfully.")
-            except Exception as e:
-                print(f"[Executor][GTC] Cancel failed for {order_id}: {e}")
-            finally:
-                self._gtc_timers.pop(order_id, None)
-
-        timer = threading.Timer(timeout, _cancel)
-        timer.daemon = True
-        timer.start()
-        self._gtc_timers[order_id] = timer
-        print(f"[Executor][GTC] Auto-cancel scheduled in {timeout}s for order {order_id}")
+        self._ensure_gtc_thread()
+        with self._gtc_lock:
+            heapq.heappush(self._gtc_heap, (time.time() + timeout, order_id))
+            self._gtc_pending.add(order_id)
+        self._gtc_wakeup.set()
+        logger.info("[Executor][GTC] Auto-cancel scheduled in %ss for order %s", timeout, order_id)
 
     def cancel_gtc_order(self, order_id: str) -> bool:
-        """Manually cancel a GTC order and clear its timer."""
-        timer = self._gtc_timers.pop(order_id, None)
-        if timer:
-            timer.cancel()
+        """Manually cancel a GTC order and clear its timeout."""
+        with self._gtc_lock:
+            self._gtc_pending.discard(order_id)   # heap entry dropped lazily
         try:
             self.client.cancel(order_id)
-            print(f"[Executor][GTC] Manually cancelled order {order_id}")
+            logger.info("[Executor][GTC] Manually cancelled order %s", order_id)
             return True
         except Exception as e:
-            print(f"[Executor][GTC] Manual cancel failed for {order_id}: {e}")
+            logger.warning("[Executor][GTC] Manual cancel failed for %s: %s", order_id, e)
             return False
 
     def cancel_all_gtc_orders(self) -> None:
-        """Cancel all pending GTC orders and their timers."""
-        for order_id in list(self._gtc_timers.keys()):
-            self.cancel_gtc_order(order_id)
+        """Cancel all pending GTC orders and their timeouts."""
+        with self._gtc_lock:
+            pending = list(self._gtc_pending)
+            self._gtc_pending.clear()   # expiry thread drops heap entries lazily
+        if not pending:
+            return
+
+        # One bulk round trip instead of a serial cancel per order
+        if hasattr(self.client, "cancel_orders"):
+            try:
+                self.client.cancel_orders(pending)
+                logger.info("[Executor][GTC] Cancelled %d orders in one batch", len(pending))
+                return
+            except Exception as e:
+                logger.warning("[Executor][GTC] Batch cancel failed (%s) — falling back to per-order", e)
+
+        for order_id in pending:
+            try:
+                self.client.cancel(order_id)
+                logger.info("[Executor][GTC] Manually cancelled order %s", order_id)
+            except Exception as e:
+                logger.warning("[Executor][GTC] Manual cancel failed for %s: %s", order_id, e)
 
     # ── Order placement ────────────────────────────────────────────────────────
 
     def _place_fok_order(
         self, token_id: str, price_f: float, size_tokens: float, side: str
     ) -> Any:
-        args   = OrderArgs(token_id=token_id, price=price_f, size=size_tokens, side=side)
+        # Positional construction: OrderArgs declares (token_id, price,
+        # size, side) first, so this skips the kwarg-dict binding
+        args   = OrderArgs(token_id, price_f, size_tokens, side)
         signed = self.client.create_order(args)
         return self.client.post_order(signed, OrderType.FOK)
 
@@ -276,16 +469,17 @@ class OrderExecutor:
         side: str, copy_size: float
     ) -> Any:
         try:
+            # Floor to cents in float; the epsilon keeps exact values
+            # like 28.31 from landing a hair under their grid line
             margs  = MarketOrderArgs(
                 token_id = token_id,
-                amount   = float(Decimal(str(copy_size)).quantize(
-                               Decimal("0.01"), rounding=ROUND_DOWN)),
+                amount   = math.floor(copy_size * 100 + 1e-9) / 100.0,
                 side     = side,
             )
             signed = self.client.create_market_order(margs)
             return self.client.post_order(signed, OrderType.FAK)
         except Exception as fak_err:
-            print(f"[Executor] FAK MarketOrderArgs failed ({fak_err}) — falling back to FOK")
+            logger.warning("[Executor] FAK MarketOrderArgs failed (%s) — falling back to FOK", fak_err)
             return self._place_fok_order(token_id, price_f, size_tokens, side)
 
     def _place_gtc_order(
@@ -295,10 +489,48 @@ class OrderExecutor:
         Post a GTC limit order at the exact price.
         Returns the API response dict (contains order_id for timeout tracking).
         """
-        args   = OrderArgs(token_id=token_id, price=price_f, size=size_tokens, side=side)
+        args   = OrderArgs(token_id, price_f, size_tokens, side)
         signed = self.client.create_order(args)
         return self.client.post_order(signed, OrderType.GTC)
 
+    @staticmethod
+    def _gtc_price_size(side: str, raw_price: float, copy_size: float,
+                        tick_size) -> Tuple[float, float]:
+        """GTC posts at the trader's EXACT price — no slippage buffer."""
+        return _gtc_order_params(raw_price, copy_size, tick_size)
+
+    @staticmethod
+    def _slip_price_size(side: str, raw_price: float, copy_size: float,
+                         tick_size) -> Tuple[float, float]:
+        """FOK/FAK: one-cent slippage toward fill, snapped to the grid."""
+        if side == "BUY":
+            slippage_price = min(raw_price + 0.01, 0.99)
+        else:
+            slippage_price = max(raw_price - 0.01, 0.01)
+
+        # Snap + clamp in tick units: round-half-up then pin to
+        # [1 tick, 1.0 - 1 tick], no round() calls in the path
+        tick = float(tick_size)
+        inv_tick = 1.0 / tick
+        snapped_ticks = max(1, min(int(slippage_price * inv_tick + 0.5),
+                                   int(inv_tick) - 1))
+        return _safe_order_params(snapped_ticks * tick, copy_size, tick_size)
+
+    def _extract_order_id(self, response: Dict[str, Any]) -> Optional[str]:
+        """Pull the order id out of an API response, remembering which
+        key the server uses so steady-state orders probe just one."""
+        if self._order_id_key is not None:
+            order_id = response.get(self._order_id_key)
+            if order_id:
+                return order_id
+
+        for key in ("orderID", "order_id", "id"):
+            order_id = response.get(key)
+            if order_id:
+                self._order_id_key = key
+                return order_id
+        return None
+
     # ── Main execute method ────────────────────────────────────────────────────
 
     def execute_copy_trade(
@@ -329,93 +561,95 @@ class OrderExecutor:
         }
 
         try:
+            # Kick off the market-info fetch first: it only needs the
+            # condition_id, so its network latency (on cache misses)
+            # overlaps the local size calculation instead of
+            # serializing after it
+            info_future = self._io_pool.submit(
+                self.get_market_info, original_trade.condition_id)
+
             # ── 1. Calculate copy size ────────────────────────────────────
             copy_size, reason = self.calculate_copy_size(original_trade, trader_config)
             result["copy_size_usdc"] = copy_size
             result["reason"]         = reason
 
             if copy_size <= 0:
-                print(f"[Executor] Skipping trade: {reason}")
+                info_future.cancel()
+                logger.info("[Executor] Skipping trade: %s", reason)
                 return result
 
-            print(f"[Executor] Copying trade: {reason}")
-            print(f"  Original: {original_trade}")
+            logger.info("[Executor] Copying trade: %s\n  Original: %s",
+                        reason, original_trade)
 
             # ── 2. Token ID ───────────────────────────────────────────────
             token_id = original_trade.token_id
             if not token_id:
+                info_future.cancel()
                 result["error"] = "No token ID in trade data"
-                print(f"[Executor] Error: {result['error']}")
+                logger.error("[Executor] Error: %s", result["error"])
                 return result
 
-            print(f"[Executor] Token ID: {token_id}")
+            logger.info("[Executor] Token ID: %s", token_id)
 
             # ── 3. Dry-run guard ──────────────────────────────────────────
             if self.dry_run:
-                print("[Executor] DRY RUN - Would execute trade")
+                info_future.cancel()
+                logger.info("[Executor] DRY RUN - Would execute trade")
                 result["success"]  = True
                 result["order_id"] = "DRY_RUN"
                 return result
 
-            # ── 4. Market info ────────────────────────────────────────────
-            market_info = self.get_market_info(original_trade.condition_id)
-            tick_size   = "0.01"
-            neg_risk    = False
+            # ── 4. Market info (fetch was started above) ──────────────────
+            tick_size = "0.01"
+            neg_risk  = False
+            try:
+                market_info = info_future.result(timeout=2.0)
+            except Exception:
+                # A slow Gamma response shouldn't stall the order; fall
+                # back to the defaults above
+                market_info = None
 
             if market_info:
                 tick_size = market_info.get("minimum_tick_size", "0.01")
                 neg_risk  = market_info.get("neg_risk", False)
-                print(f"[Executor] Market info: tick_size={tick_size}, neg_risk={neg_risk}")
+                logger.info("[Executor] Market info: tick_size=%s, neg_risk=%s", tick_size, neg_risk)
 
             # ── 5. Price & size calculation (varies by order type) ────────
-            order_type_str = self.copy_config.order_type   # FOK | FAK | GTC
+            order_type_str = result["order_type"]          # FOK | FAK | GTC
             side           = original_trade.side
-            raw_price      = original_trade.price
-            tick           = float(tick_size)
 
-            if order_type_str == "GTC":
-                # ── GTC: use EXACT original price, no slippage ────────────
-                price_f, size_tokens = _gtc_order_params(raw_price, copy_size, tick_size)
-
-            else:
-                # ── FOK / FAK: add slippage buffer for better fill chance ─
-                if side == "BUY":
-                    slippage_price = min(raw_price + 0.01, 0.99)
-                else:
-                    slippage_price = max(raw_price - 0.01, 0.01)
-
-                snapped  = round(round(slippage_price / tick) * tick, 10)
-                snapped  = max(tick, min(snapped, 1.0 - tick))
-                price_f, size_tokens = _safe_order_params(snapped, copy_size, tick_size)
-
-            print(f"[Executor] Order params:")
-            print(f"  Token ID   : {token_id}")
-            print(f"  Price      : {price_f:.4f}"
-                  + (" (exact — no slippage)" if order_type_str == "GTC" else " (+slippage)"))
-            print(f"  Size       : {size_tokens:.4f} tokens (~${price_f * size_tokens:.2f})")
-            print(f"  Side       : {side}")
-            print(f"  Order Type : {order_type_str}")
+            price_fn, place_fn = (self._dispatch.get(order_type_str)
+                                  or self._dispatch["FOK"])
+            price_f, size_tokens = price_fn(
+                side, original_trade.price, copy_size, tick_size)
+
+            if logger.isEnabledFor(logging.INFO):
+                # One deferred log call instead of six stdout writes;
+                # float formatting only happens when INFO is live
+                logger.info(
+                    "[Executor] Order params:\n"
+                    "  Token ID   : %s\n"
+                    "  Price      : %.4f%s\n"
+                    "  Size       : %.4f tokens (~$%.2f)\n"
+                    "  Side       : %s\n"
+                    "  Order Type : %s",
+                    token_id,
+                    price_f,
+                    " (exact — no slippage)" if order_type_str == "GTC" else " (+slippage)",
+                    size_tokens, price_f * size_tokens,
+                    side, order_type_str,
+                )
 
             # ── 6. Place order ────────────────────────────────────────────
-            if order_type_str == "GTC":
-                response = self._place_gtc_order(token_id, price_f, size_tokens, side)
-            elif order_type_str == "FAK":
-                response = self._place_fak_order(
-                    token_id, price_f, size_tokens, side, copy_size)
-            else:
-                response = self._place_fok_order(token_id, price_f, size_tokens, side)
+            response = place_fn(token_id, price_f, size_tokens, side, copy_size)
 
             # ── 7. Handle response ────────────────────────────────────────
             if response:
-                order_id = (
-                    response.get("orderID")
-                    or response.get("order_id")
-                    or response.get("id")
-                )
+                order_id = self._extract_order_id(response)
                 result["success"]  = True
                 result["order_id"] = order_id
                 self.executed_trades.append(result)
-                print(f"[Executor] Order placed successfully! ID: {order_id}")
+                logger.info("[Executor] Order placed successfully! ID: %s", order_id)
 
                 # GTC: schedule auto-cancel timer
                 if order_type_str == "GTC" and order_id:
@@ -426,49 +660,92 @@ class OrderExecutor:
             else:
                 result["error"] = "No response from API"
                 self.failed_trades.append(result)
-                print("[Executor] No response from API")
+                logger.warning("[Executor] No response from API")
 
         except Exception as e:
             result["error"] = str(e)
             self.failed_trades.append(result)
-            print(f"[Executor] Error executing trade: {e}")
-            import traceback
-            traceback.print_exc()
+            # logger.exception defers traceback formatting to the
+            # handler instead of rendering + printing it inline
+            logger.exception("Error executing trade: %s", e)
 
         return result
 
+    BATCH_CAP = 50  # mirrors typical exchange batch-order limits
+
+    def execute_copy_trades_batch(
+        self,
+        trades:        list,
+        trader_config: Optional[TraderConfig] = None,
+    ) -> list:
+        """
+        Copy several trades fired from one monitored fill.
+
+        The market-info cache is warmed once per unique market, then
+        the orders are signed and posted concurrently, so N
+        simultaneous trades cost roughly one round-trip of wall clock
+        instead of N. The CLOB client posts per order (no batch place
+        endpoint), so concurrency is where the win comes from.
+
+        Returns one result dict per trade, in input order.
+        """
+        if not trades:
+            return []
+        if len(trades) > self.BATCH_CAP:
+            logger.warning("[Executor] Batch of %d trades capped at %d",
+                           len(trades), self.BATCH_CAP)
+            trades = trades[:self.BATCH_CAP]
+
+        if len(trades) == 1:
+            return [self.execute_copy_trade(trades[0], trader_config)]
+
+        # Dedicated pool: execute_copy_trade leans on self._io_pool for
+        # its own metadata prefetch, so running the trades there too
+        # could saturate it and stall the inner futures
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(trades)),
+            thread_name_prefix="executor-batch",
+        ) as pool:
+            # One fetch per unique market; the per-trade prefetches
+            # then resolve from cache
+            for cid in {t.condition_id for t in trades if t.condition_id}:
+                pool.submit(self.get_market_info, cid)
+
+            futures = [pool.submit(self.execute_copy_trade, t, trader_config)
+                       for t in trades]
+            return [f.result() for f in futures]
+
     # ── Utility methods ────────────────────────────────────────────────────────
 
     def get_open_orders(self) -> list:
         try:
             return self.client.get_orders()
         except Exception as e:
-            print(f"[Executor] Error getting orders: {e}")
+            logger.error("[Executor] Error getting orders: %s", e)
             return []
 
     def cancel_all_orders(self) -> bool:
         try:
             self.cancel_all_gtc_orders()   # clear GTC timers first
             self.client.cancel_all()
-            print("[Executor] Cancelled all orders")
+            logger.info("[Executor] Cancelled all orders")
             return True
         except Exception as e:
-            print(f"[Executor] Error cancelling orders: {e}")
+            logger.error("[Executor] Error cancelling orders: %s", e)
             return False
 
     def get_balances(self) -> Dict[str, float]:
         try:
             return self.client.get_balance_allowance()
         except Exception as e:
-            print(f"[Executor] Error getting balances: {e}")
+            logger.error("[Executor] Error getting balances: %s", e)
             return {}
 
 
 # ── Smoke-test ─────────────────────────────────────────────────────────────────
 
 def test_executor():
-    from dotenv import load_dotenv
-    load_dotenv()
+    _load_dotenv_once()
 
     auth = PolymarketAuth(
         private_key    = os.getenv("PRIVATE_KEY"),
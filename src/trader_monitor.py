@@ -2,18 +2,35 @@
 Trader Activity Monitor
 
 Monitors Polymarket trader activity using:
-- Data API for historical trades
-- WebSocket for real-time updates
+- WebSocket activity stream for real-time trade detection
+- Data API polling as a slow reconciliation fallback
 """
 
 import asyncio
+import functools
 import json
+import os
+import threading
 import time
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from websocket_client import PolymarketWebSocket, WSMessage
+
+
+def _json_loads(data) -> Any:
+    """Parse JSON with orjson when available (2-5x faster than stdlib)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 @dataclass
 class Trade:
@@ -94,13 +111,27 @@ class TraderConfig:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """
+    Process-wide keep-alive session used as the default transport for
+    all API clients. Pooling the TCP+TLS connections saves a handshake
+    (~100ms) per request — usually the biggest single latency win on
+    the order-placement path.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("https://", adapter)
+    return session
+
+
 class DataAPIClient:
     """Client for Polymarket Data API (public endpoints)"""
-    
+
     BASE_URL = "https://data-api.polymarket.com"
-    
+
     def __init__(self, session: Optional[requests.Session] = None):
-        self.session = session or requests.Session()
+        self.session = session or _shared_session()
     
     def get_user_activity(
         self,
@@ -140,7 +171,7 @@ class DataAPIClient:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     def get_trades(
         self,
@@ -160,8 +191,44 @@ class DataAPIClient:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
+    def get_activity_bulk(
+        self,
+        user_addresses: List[str],
+        limit: int = 500,
+        activity_type: Optional[str] = "TRADE",
+        start_ts: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get activity for several users in one request
+
+        The activity endpoint accepts a comma-joined user list, so one
+        round-trip replaces N per-trader calls per poll cycle.
+
+        Args:
+            user_addresses: Wallet addresses (0x prefixed)
+            limit: Number of results across all users (max 500)
+            activity_type: Filter by type (TRADE, SPLIT, MERGE, etc.)
+            start_ts: Start timestamp filter
+        """
+        params = {
+            "user": ",".join(user_addresses),
+            "limit": min(limit, 500),
+        }
+
+        if activity_type:
+            params["type"] = activity_type
+        if start_ts:
+            params["start"] = start_ts
+
+        response = self.session.get(
+            f"{self.BASE_URL}/activity",
+            params=params
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
+
     def get_current_positions(self, user_address: str) -> List[Dict[str, Any]]:
         """Get current positions for a user"""
         response = self.session.get(
@@ -169,7 +236,7 @@ class DataAPIClient:
             params={"user": user_address}
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
 
 class GammaAPIClient:
@@ -178,8 +245,8 @@ class GammaAPIClient:
     BASE_URL = "https://gamma-api.polymarket.com"
     
     def __init__(self, session: Optional[requests.Session] = None):
-        self.session = session or requests.Session()
-    
+        self.session = session or _shared_session()
+
     def get_markets(
         self,
         limit: int = 100,
@@ -198,7 +265,7 @@ class GammaAPIClient:
             params=params
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     def get_market_by_condition_id(self, condition_id: str) -> Optional[Dict[str, Any]]:
         """Get market by condition ID"""
@@ -208,7 +275,7 @@ class GammaAPIClient:
                 params={"condition_id": condition_id}
             )
             response.raise_for_status()
-            markets = response.json()
+            markets = _json_loads(response.content)
             return markets[0] if markets else None
         except Exception as e:
             print(f"[Gamma] Error getting market: {e}")
@@ -221,7 +288,7 @@ class GammaAPIClient:
             params={"slug": slug}
         )
         response.raise_for_status()
-        markets = response.json()
+        markets = _json_loads(response.content)
         return markets[0] if markets else None
     
     def get_token_info(self, condition_id: str, outcome_index: int) -> Optional[Dict[str, Any]]:
@@ -245,46 +312,77 @@ class GammaAPIClient:
 class TraderMonitor:
     """
     Monitors trader activity and detects NEW trades only
-    
-    Uses polling (Data API) for reliable detection.
+
+    Uses the WebSocket activity stream for low-latency detection when a
+    ws_client is provided, with Data API polling as a slow reconciliation
+    fallback for events missed during reconnects.
     Only detects trades that occur AFTER the bot starts.
     """
-    
+
     def __init__(
         self,
         traders: List[TraderConfig],
-        poll_interval: float = 5.0,
-        on_trade_callback: Optional[Callable[[Trade, TraderConfig], None]] = None
+        poll_interval: float = 60.0,
+        on_trade_callback: Optional[Callable[[Trade, TraderConfig], None]] = None,
+        ws_client: Optional[PolymarketWebSocket] = None
     ):
         """
         Initialize monitor
-        
+
         Args:
             traders: List of traders to monitor
-            poll_interval: Seconds between polling
+            poll_interval: Seconds between reconciliation polls
             on_trade_callback: Callback when new trade is detected
+            ws_client: Optional WebSocket client for push-based detection
         """
         self.traders = {t.address.lower(): t for t in traders}
+        # Enabled-only index, built once so event dispatch and the poll
+        # fan-out never re-filter the full trader dict
+        self._enabled_traders = {
+            addr: t for addr, t in self.traders.items() if t.enabled
+        }
         self.poll_interval = poll_interval
         self.on_trade_callback = on_trade_callback
-        
-        self.data_api = DataAPIClient()
-        self.gamma_api = GammaAPIClient()
-        
+        self.ws_client = ws_client
+
+        # One keep-alive session shared by both API clients (and the
+        # executor's Gamma client): avoids re-doing DNS/TCP/TLS per
+        # poll and is pooled wide enough for the concurrent fan-out
+        self._http_session = _shared_session()
+
+        self.data_api = DataAPIClient(session=self._http_session)
+        self.gamma_api = GammaAPIClient(session=self._http_session)
+
         self._running = False
         self._seen_transactions: Dict[str, set] = {}  # address -> set of seen tx hashes
+        # Guards check-and-insert on the dedup sets: the WS callback
+        # (event loop thread) and the reconciliation poll (to_thread)
+        # can race on the same tx hash and double-dispatch a trade
+        self._seen_lock = threading.Lock()
         self._bot_start_time: int = 0  # Timestamp when bot started
+        self._ws_task: Optional[asyncio.Task] = None
+        self._poll_semaphore: Optional[asyncio.Semaphore] = None
+
+        # Adaptive polling: back off while traders are idle, snap back
+        # to the base interval as soon as a trade lands
+        self._empty_streak: int = 0
+        self._min_interval = float(os.getenv("POLL_INTERVAL_MIN", str(poll_interval)))
+        self._max_interval = float(os.getenv("POLL_INTERVAL_MAX", str(poll_interval * 8)))
     
     def add_trader(self, trader: TraderConfig) -> None:
         """Add a trader to monitor"""
-        self.traders[trader.address.lower()] = trader
+        addr_lower = trader.address.lower()
+        self.traders[addr_lower] = trader
+        if trader.enabled:
+            self._enabled_traders[addr_lower] = trader
         print(f"[Monitor] Added trader: {trader.nickname or trader.address}")
-    
+
     def remove_trader(self, address: str) -> None:
         """Remove a trader from monitoring"""
         addr_lower = address.lower()
         if addr_lower in self.traders:
             del self.traders[addr_lower]
+            self._enabled_traders.pop(addr_lower, None)
             print(f"[Monitor] Removed trader: {address}")
     
     def update_trader_state(self, address: str, trade_ts: int) -> None:
@@ -305,14 +403,14 @@ class TraderMonitor:
                 activity_type="TRADE"
             )
             
-            if address.lower() not in self._seen_transactions:
-                self._seen_transactions[address.lower()] = set()
-            
-            # Mark ALL existing trades as seen
-            for act in activity:
-                tx_hash = act.get("transactionHash", "")
-                if tx_hash:
-                    self._seen_transactions[address.lower()].add(tx_hash)
+            with self._seen_lock:
+                seen = self._seen_transactions.setdefault(address.lower(), set())
+
+                # Mark ALL existing trades as seen
+                for act in activity:
+                    tx_hash = act.get("transactionHash", "")
+                    if tx_hash:
+                        seen.add(tx_hash)
             
             # Update last known timestamp from existing trades
             if activity:
@@ -332,8 +430,6 @@ class TraderMonitor:
         Returns:
             List of new trades (empty if none)
         """
-        new_trades = []
-        
         try:
             # Get recent activity
             activity = self.data_api.get_user_activity(
@@ -341,65 +437,192 @@ class TraderMonitor:
                 limit=50,
                 activity_type="TRADE"
             )
-            
-            if address.lower() not in self._seen_transactions:
-                self._seen_transactions[address.lower()] = set()
-            
+            return self._extract_new_trades(address.lower(), activity)
+
+        except Exception as e:
+            print(f"[Monitor] Error checking {address[:10]}...: {e}")
+            return []
+
+    def _extract_new_trades(
+        self, address: str, activity: List[Dict[str, Any]]
+    ) -> List[Trade]:
+        """Filter raw activity down to unseen post-start trades"""
+        # Claim unseen tx hashes atomically so the WS path can't
+        # dispatch the same tx between our check and our add; Trade
+        # construction happens outside the lock
+        unseen = []
+        with self._seen_lock:
+            seen = self._seen_transactions.setdefault(address, set())
+
             for act in activity:
                 tx_hash = act.get("transactionHash", "")
                 trade_ts = act.get("timestamp", 0)
-                
+
                 # Skip if already seen
-                if tx_hash and tx_hash in self._seen_transactions[address.lower()]:
+                if tx_hash and tx_hash in seen:
                     continue
-                
+
                 # Skip if trade happened before bot started
                 if trade_ts < self._bot_start_time:
                     continue
-                
-                # This is a NEW trade!
-                trade = Trade.from_api_response(act)
-                new_trades.append(trade)
-                
-                # Mark as seen
+
+                # This is a NEW trade — mark as seen
                 if tx_hash:
-                    self._seen_transactions[address.lower()].add(tx_hash)
-            
-            if new_trades:
-                # Sort by timestamp (oldest first for proper order)
-                new_trades.sort(key=lambda t: t.timestamp)
-                latest_ts = new_trades[-1].timestamp
-                self.update_trader_state(address, latest_ts)
-            
-        except Exception as e:
-            print(f"[Monitor] Error checking {address[:10]}...: {e}")
-        
+                    seen.add(tx_hash)
+                unseen.append(act)
+
+        new_trades = [Trade.from_api_response(act) for act in unseen]
+
+        if new_trades:
+            # Sort by timestamp (oldest first for proper order)
+            new_trades.sort(key=lambda t: t.timestamp)
+            self.update_trader_state(address, new_trades[-1].timestamp)
+
         return new_trades
     
+    def _handle_ws_message(self, message: WSMessage) -> None:
+        """
+        Handle a push event from the activity WebSocket.
+
+        Parses trade events for monitored traders and dispatches them
+        through the same dedup + callback path as the poll loop.
+        """
+        payload = message.data.get("payload", message.data)
+        if not isinstance(payload, dict):
+            return
+
+        # Only TRADE events carry the fields we copy from
+        event_type = payload.get("type", message.type)
+        if event_type not in ("TRADE", "trades", "activity"):
+            return
+
+        address = payload.get("proxyWallet", "").lower()
+        trader = self._enabled_traders.get(address)
+        if not trader:
+            return
+
+        tx_hash = payload.get("transactionHash", "")
+        trade_ts = payload.get("timestamp", 0)
+
+        # Same filters as the polled path: dedupe and ignore pre-start
+        # trades. Check-and-insert is atomic with respect to the poll
+        # thread so the same tx can't be dispatched by both.
+        with self._seen_lock:
+            seen = self._seen_transactions.setdefault(address, set())
+            if tx_hash and tx_hash in seen:
+                return
+            if trade_ts < self._bot_start_time:
+                return
+            if tx_hash:
+                seen.add(tx_hash)
+
+        trade = Trade.from_api_response(payload)
+        self.update_trader_state(address, trade.timestamp)
+        self._dispatch_trade(trade, trader)
+
+    def _dispatch_trade(self, trade: Trade, trader: TraderConfig) -> None:
+        """Print a detected trade and invoke the callback"""
+        ts_str = datetime.fromtimestamp(trade.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"\n[Monitor] NEW TRADE DETECTED!")
+        print(f"  Trader: {trader.nickname or trade.trader_address[:10]}...")
+        print(f"  Time: {ts_str}")
+        print(f"  {trade}")
+        print(f"  Token ID: {trade.token_id}")
+
+        if self.on_trade_callback:
+            try:
+                self.on_trade_callback(trade, trader)
+            except Exception as e:
+                print(f"[Monitor] Callback error: {e}")
+
     def check_all_traders(self) -> List[tuple]:
         """
-        Check all traders for new activity
-        
+        Check all traders for new activity (sequential)
+
         Returns:
             List of (trade, trader_config) tuples
         """
         all_new_trades = []
-        
+
         for address, trader in self.traders.items():
             if not trader.enabled:
                 continue
-            
+
             new_trades = self.check_trader_activity(address)
-            
+
             for trade in new_trades:
                 all_new_trades.append((trade, trader))
-        
+
+        return all_new_trades
+
+    def check_all_traders_bulk(self) -> List[tuple]:
+        """
+        Check all enabled traders with a single bulk Data API call
+
+        One round-trip replaces N per-trader requests; results are
+        grouped by proxyWallet and run through the same dedup filters.
+
+        Returns:
+            List of (trade, trader_config) tuples
+        """
+        if not self._enabled_traders:
+            return []
+
+        activity = self.data_api.get_activity_bulk(
+            [t.address for t in self._enabled_traders.values()],
+            activity_type="TRADE",
+            start_ts=self._bot_start_time or None
+        )
+
+        # Group events per trader so dedup state stays per-address
+        by_address: Dict[str, List[Dict[str, Any]]] = {}
+        for act in activity:
+            addr = act.get("proxyWallet", "").lower()
+            if addr in self._enabled_traders:
+                by_address.setdefault(addr, []).append(act)
+
+        all_new_trades = []
+        for addr, acts in by_address.items():
+            trader = self._enabled_traders[addr]
+            for trade in self._extract_new_trades(addr, acts):
+                all_new_trades.append((trade, trader))
+
+        return all_new_trades
+
+    async def _poll_trader(self, address: str, trader: TraderConfig) -> List[tuple]:
+        """Poll a single trader without blocking the event loop"""
+        async with self._poll_semaphore:
+            new_trades = await asyncio.to_thread(self.check_trader_activity, address)
+        return [(trade, trader) for trade in new_trades]
+
+    async def check_all_traders_async(self) -> List[tuple]:
+        """
+        Check all traders for new activity concurrently
+
+        Polls fan out with asyncio.gather so a cycle takes roughly the
+        slowest single request rather than the sum of all of them.
+
+        Returns:
+            List of (trade, trader_config) tuples
+        """
+        results = await asyncio.gather(*(
+            self._poll_trader(address, trader)
+            for address, trader in self._enabled_traders.items()
+        ))
+
+        all_new_trades = []
+        for trades in results:
+            all_new_trades.extend(trades)
+
         return all_new_trades
     
     async def run_async(self) -> None:
         """Run the monitor loop asynchronously"""
         self._running = True
         self._bot_start_time = int(time.time())  # Record when bot started
+        self._poll_semaphore = asyncio.Semaphore(
+            int(os.getenv("MAX_CONCURRENT_POLLS", "32"))
+        )
         
         print(f"[Monitor] Starting to monitor {len(self.traders)} traders...")
         print(f"[Monitor] Bot start time: {datetime.fromtimestamp(self._bot_start_time).strftime('%Y-%m-%d %H:%M:%S')}")
@@ -407,58 +630,93 @@ class TraderMonitor:
         
         # Initialize state for all traders (mark existing trades as seen)
         print(f"[Monitor] Initializing trader states...")
-        for address in self.traders:
-            self._initialize_trader_state(address)
+        await asyncio.gather(*(
+            asyncio.to_thread(self._initialize_trader_state, address)
+            for address in self.traders
+        ))
         
         print(f"[Monitor] Initialization complete. Watching for NEW trades...")
-        print(f"[Monitor] Poll interval: {self.poll_interval}s")
-        
+
+        # Start the WebSocket stream (primary detection path)
+        if self.ws_client:
+            self.ws_client.on_message = self._handle_ws_message
+            enabled = [t.address for t in self._enabled_traders.values()]
+            self._ws_task = asyncio.ensure_future(
+                self.ws_client.run_activity_forever(enabled)
+            )
+            print(f"[Monitor] WebSocket stream started for {len(enabled)} traders")
+            print(f"[Monitor] Reconciliation poll interval: {self.poll_interval}s")
+        else:
+            print(f"[Monitor] Poll interval: {self.poll_interval}s")
+
+        # Poll loop: primary detection without a ws_client, otherwise a slow
+        # reconciliation pass that catches events missed during reconnects
         while self._running:
             try:
-                new_trades = self.check_all_traders()
-                
+                try:
+                    # Single bulk request covers every enabled trader
+                    new_trades = await asyncio.to_thread(self.check_all_traders_bulk)
+                except Exception as e:
+                    # Bulk endpoint unavailable: fall back to the
+                    # concurrent per-trader fan-out
+                    print(f"[Monitor] Bulk poll failed ({e}), polling per trader")
+                    new_trades = await self.check_all_traders_async()
+
                 for trade, trader in new_trades:
-                    ts_str = datetime.fromtimestamp(trade.timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                    print(f"\n[Monitor] NEW TRADE DETECTED!")
-                    print(f"  Trader: {trader.nickname or trade.trader_address[:10]}...")
-                    print(f"  Time: {ts_str}")
-                    print(f"  {trade}")
-                    print(f"  Token ID: {trade.token_id}")
-                    
-                    if self.on_trade_callback:
-                        try:
-                            self.on_trade_callback(trade, trader)
-                        except Exception as e:
-                            print(f"[Monitor] Callback error: {e}")
-                
-                await asyncio.sleep(self.poll_interval)
-                
+                    self._dispatch_trade(trade, trader)
+
+                if new_trades:
+                    self._empty_streak = 0
+                else:
+                    self._empty_streak += 1
+
+                await asyncio.sleep(self._next_poll_interval())
+
             except Exception as e:
                 print(f"[Monitor] Loop error: {e}")
-                await asyncio.sleep(self.poll_interval)
-    
+                await asyncio.sleep(self._next_poll_interval())
+
+        if self._ws_task:
+            self._ws_task.cancel()
+
+    def _next_poll_interval(self) -> float:
+        """Current poll interval, backed off exponentially on idle cycles"""
+        interval = self._min_interval * (2 ** min(self._empty_streak, 4))
+        return min(self._max_interval, max(self._min_interval, interval))
+
     def run(self) -> None:
         """Run the monitor loop (blocking)"""
         try:
             asyncio.run(self.run_async())
         except KeyboardInterrupt:
             print("\n[Monitor] Stopped by user")
-    
+
     def stop(self) -> None:
         """Stop the monitor"""
         self._running = False
 
 
+@functools.lru_cache(maxsize=4)
+def _load_traders_cached(filepath: str, mtime: float) -> tuple:
+    """
+    Parse traders.json once per (path, mtime).
+
+    The mtime key invalidates the cache whenever the file is edited, so
+    hot reloads skip the re-parse without ever serving stale config.
+    """
+    with open(filepath, "rb") as f:
+        data = _json_loads(f.read())
+
+    return tuple(data.get("traders", []))
+
+
 def load_traders_from_json(filepath: str) -> List[TraderConfig]:
     """Load trader configurations from JSON file"""
-    with open(filepath, "r") as f:
-        data = json.load(f)
-    
-    traders = []
-    for t in data.get("traders", []):
-        traders.append(TraderConfig.from_dict(t))
-    
-    return traders
+    raw_traders = _load_traders_cached(filepath, os.path.getmtime(filepath))
+
+    # Build fresh TraderConfig objects per call: they carry runtime state
+    # (last_known_trade_ts etc.) that must not leak across reloads
+    return [TraderConfig.from_dict(t) for t in raw_traders]
 
 
 if __name__ == "__main__":
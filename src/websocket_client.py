@@ -10,6 +10,7 @@ Channels:
 
 import asyncio
 import json
+import random
 import time
 from typing import Optional, Callable, Dict, Any, List, Set
 from dataclasses import dataclass
@@ -53,6 +54,7 @@ class PolymarketWebSocket:
     
     MARKET_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     USER_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+    ACTIVITY_WS_URL = "wss://ws-live-data.polymarket.com"
     
     def __init__(
         self,
@@ -85,6 +87,7 @@ class PolymarketWebSocket:
         self._running = False
         self._subscribed_assets: Set[str] = set()
         self._subscribed_markets: Set[str] = set()
+        self._subscribed_users: Set[str] = set()
         self._last_ping = 0.0
     
     @property
@@ -168,6 +171,38 @@ class PolymarketWebSocket:
         await self._send(message)
         print("[WS] Subscribed to user channel")
     
+    async def connect_activity_channel(self) -> None:
+        """Connect to the live-data activity WebSocket (public)"""
+        print("[WS] Connecting to activity channel...")
+        self._ws = await websockets.connect(self.ACTIVITY_WS_URL)
+        self._running = True
+        print("[WS] Connected to activity channel")
+
+        if self.on_connect:
+            self.on_connect()
+
+    async def subscribe_activity(self, users: List[str]) -> None:
+        """
+        Subscribe to trade activity for specific users
+
+        Args:
+            users: List of proxy wallet addresses to watch
+        """
+        message = {
+            "action": "subscribe",
+            "subscriptions": [
+                {
+                    "topic": "activity",
+                    "type": "trades",
+                    "filters": json.dumps({"users": users})
+                }
+            ]
+        }
+
+        await self._send(message)
+        self._subscribed_users.update(users)
+        print(f"[WS] Subscribed to activity for {len(users)} users")
+
     async def unsubscribe_assets(self, asset_ids: List[str]) -> None:
         """Unsubscribe from specific assets"""
         message = {
@@ -263,6 +298,37 @@ class PolymarketWebSocket:
                 await asyncio.sleep(retry_delay)
                 retry_delay = min(retry_delay * 2, 60)  # Exponential backoff
 
+    async def run_activity_forever(self, users: List[str]) -> None:
+        """
+        Keep an activity-channel subscription alive with automatic
+        reconnection and re-subscribe. Backs off exponentially with
+        jitter so reconnect storms don't synchronize.
+        """
+        retry_delay = 1
+
+        while True:
+            try:
+                async with websockets.connect(self.ACTIVITY_WS_URL) as ws:
+                    self._ws = ws
+                    self._running = True
+                    retry_delay = 1  # Reset retry delay on successful connection
+
+                    await self.subscribe_activity(users)
+
+                    if self.on_connect:
+                        self.on_connect()
+
+                    await self.listen()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = retry_delay + random.uniform(0, 1)
+                print(f"[WS] Activity stream error: {e}")
+                print(f"[WS] Reconnecting in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+                retry_delay = min(retry_delay * 2, 60)  # Exponential backoff
+
 
 class MarketActivityMonitor:
     """